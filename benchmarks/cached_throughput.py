@@ -0,0 +1,77 @@
+"""
+Measures CachedFeatureFlagStore read throughput as the number of threads grows,
+with a single lock (shards=1) and with a lock-striped cache.
+
+Usage:
+
+    python benchmarks/cached_throughput.py
+
+The package must be importable, e.g. after `make install-dev`.
+
+The cache is smaller than the set of flags being read, so every thread keeps
+evicting and reloading entries and the cache locks see real contention.
+"""
+import random
+import threading
+import time
+from typing import List
+
+from flipper import CachedFeatureFlagStore, MemoryFeatureFlagStore
+
+FLAG_COUNT = 2000
+CACHE_SIZE = 1000
+DURATION = 1.0
+THREAD_COUNTS = [1, 8, 32]
+SHARD_COUNTS = [1, 16]
+
+
+def make_store(shards: int) -> CachedFeatureFlagStore:
+    store = MemoryFeatureFlagStore()
+    for index in range(FLAG_COUNT):
+        store.create("flag-%d" % index, is_enabled=True)
+    return CachedFeatureFlagStore(store, size=CACHE_SIZE, shards=shards)
+
+
+def measure(shards: int, thread_count: int) -> float:
+    store = make_store(shards)
+    feature_names = ["flag-%d" % index for index in range(FLAG_COUNT)]
+    counts = [0] * thread_count  # type: List[int]
+    start = threading.Event()
+    stop = threading.Event()
+
+    def read(slot: int) -> None:
+        names = list(feature_names)
+        random.shuffle(names)
+        start.wait()
+        while not stop.is_set():
+            for feature_name in names:
+                store.get(feature_name)
+            counts[slot] += len(names)
+
+    threads = [
+        threading.Thread(target=read, args=(slot,)) for slot in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+
+    started_at = time.monotonic()
+    start.set()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts) / (time.monotonic() - started_at)
+
+
+def main() -> None:
+    print("%-8s %-8s %s" % ("shards", "threads", "reads/s"))
+
+    for shards in SHARD_COUNTS:
+        for thread_count in THREAD_COUNTS:
+            throughput = measure(shards, thread_count)
+            print("%-8d %-8d %.0f" % (shards, thread_count, throughput))
+
+
+if __name__ == "__main__":
+    main()
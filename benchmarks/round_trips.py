@@ -0,0 +1,172 @@
+"""
+Counts the backend round trips performed by each FeatureFlagClient operation.
+
+Usage:
+
+    python benchmarks/round_trips.py
+
+The package must be importable, e.g. after `make install-dev`.
+
+Redis is exercised through fakeredis, S3 through moto and PostgreSQL through
+testing.postgresql (skipped when initdb is not available).
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Tuple
+
+from flipper import (
+    Condition,
+    FeatureFlagClient,
+    MemoryFeatureFlagStore,
+    PostgreSQLFeatureFlagStore,
+    RedisFeatureFlagStore,
+    S3FeatureFlagStore,
+)
+from flipper.bucketing import Percentage, PercentageBucketer
+
+FEATURE_NAME = "benchmark"
+
+OPERATIONS = {
+    "is_enabled": lambda client: client.is_enabled(FEATURE_NAME),
+    "enable": lambda client: client.enable(FEATURE_NAME),
+    "disable": lambda client: client.disable(FEATURE_NAME),
+    "get_meta": lambda client: client.get_meta(FEATURE_NAME),
+    "add_condition": lambda client: client.add_condition(
+        FEATURE_NAME, Condition(foo=True)
+    ),
+    "set_client_data": lambda client: client.set_client_data(
+        FEATURE_NAME, {"owner": "benchmarks"}
+    ),
+    "set_bucketer": lambda client: client.set_bucketer(
+        FEATURE_NAME, PercentageBucketer(percentage=Percentage(0.5))
+    ),
+    "set_conditions": lambda client: client.set_conditions(
+        FEATURE_NAME, [Condition(foo=True)]
+    ),
+    "destroy": lambda client: client.destroy(FEATURE_NAME),
+}
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def increment(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+@contextmanager
+def memory() -> Iterator[Tuple[FeatureFlagClient, Counter]]:
+    store = MemoryFeatureFlagStore()
+    counter = Counter()
+
+    get, save = store.get, store._save
+
+    def counted_get(*args, **kwargs):
+        counter.increment()
+        return get(*args, **kwargs)
+
+    def counted_save(*args, **kwargs):
+        counter.increment()
+        return save(*args, **kwargs)
+
+    store.get = counted_get  # type: ignore
+    store._save = counted_save  # type: ignore
+
+    yield FeatureFlagClient(store), counter
+
+
+@contextmanager
+def redis() -> Iterator[Tuple[FeatureFlagClient, Counter]]:
+    import fakeredis
+
+    connection = fakeredis.FakeRedis()
+    counter = Counter()
+
+    execute_command = connection.execute_command
+
+    def counted_execute_command(*args, **kwargs):
+        counter.increment()
+        return execute_command(*args, **kwargs)
+
+    connection.execute_command = counted_execute_command  # type: ignore
+
+    yield FeatureFlagClient(RedisFeatureFlagStore(connection)), counter
+
+
+@contextmanager
+def s3() -> Iterator[Tuple[FeatureFlagClient, Counter]]:
+    import boto3
+    from moto import mock_s3
+
+    with mock_s3():
+        s3_client = boto3.client(
+            "s3",
+            region_name="us-east-1",
+            aws_access_key_id="aws_access_key_id",
+            aws_secret_access_key="aws_secret_access_key",
+        )
+        s3_client.create_bucket(Bucket="flipper")
+
+        counter = Counter()
+        s3_client.meta.events.register("before-call.s3", counter.increment)
+
+        yield FeatureFlagClient(S3FeatureFlagStore(s3_client, "flipper")), counter
+
+
+@contextmanager
+def postgresql() -> Iterator[Tuple[FeatureFlagClient, Counter]]:
+    import testing.postgresql
+
+    with testing.postgresql.Postgresql() as db:
+        store = PostgreSQLFeatureFlagStore(db.url())
+        counter = Counter()
+
+        connection = store._connection
+
+        def counted_connection(*args, **kwargs):
+            counter.increment()
+            return connection(*args, **kwargs)
+
+        store._connection = counted_connection  # type: ignore
+
+        yield FeatureFlagClient(store), counter
+
+
+STORES = {
+    "memory": memory,
+    "redis": redis,
+    "s3": s3,
+    "postgresql": postgresql,
+}  # type: Dict[str, Callable]
+
+
+def measure(make_store: Callable) -> Dict[str, int]:
+    results = {}
+
+    with make_store() as (client, counter):
+        client.create(FEATURE_NAME, is_enabled=True)
+
+        for name, operation in OPERATIONS.items():
+            counter.count = 0
+            operation(client)
+            results[name] = counter.count
+
+    return results
+
+
+def main() -> None:
+    print("%-12s %-16s %s" % ("store", "operation", "round trips"))
+
+    for store_name, make_store in STORES.items():
+        try:
+            results = measure(make_store)
+        except Exception as e:
+            print("%-12s skipped (%s)" % (store_name, e))
+            continue
+
+        for operation_name, count in results.items():
+            print("%-12s %-16s %d" % (store_name, operation_name, count))
+
+
+if __name__ == "__main__":
+    main()
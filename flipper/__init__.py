@@ -20,8 +20,10 @@ from .contrib import (
     MemoryFeatureFlagStore,
     PostgreSQLFeatureFlagStore,
     RedisFeatureFlagStore,
+    RedisInvalidationSubscriber,
     ReplicatedFeatureFlagStore,
     S3FeatureFlagStore,
+    SnapshotFeatureFlagStore,
     ThriftRPCFeatureFlagStore,
 )
 from .exceptions import FlagDoesNotExistError
@@ -36,7 +38,9 @@ __all__ = [
     "MemoryFeatureFlagStore",
     "PostgreSQLFeatureFlagStore",
     "RedisFeatureFlagStore",
+    "RedisInvalidationSubscriber",
     "ReplicatedFeatureFlagStore",
     "S3FeatureFlagStore",
+    "SnapshotFeatureFlagStore",
     "ThriftRPCFeatureFlagStore",
 ]
@@ -11,7 +11,7 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Iterable, Iterator, Optional, cast
+from typing import Dict, Iterable, Iterator, Optional
 
 from .bucketing.base import AbstractBucketer
 from .conditions import Condition
@@ -22,18 +22,12 @@ from .exceptions import FlagDoesNotExistError
 from .flag import FeatureFlag
 
 
-def flag_must_exist(fn):
-    def wrapper(self, feature_name: str, *args, **kwargs):
-        if not self.exists(feature_name):
-            raise FlagDoesNotExistError()
-        return fn(self, feature_name, *args, **kwargs)
-
-    return wrapper
-
-
 class FeatureFlagClient:
-    def __init__(self, store: AbstractFeatureFlagStore) -> None:
+    def __init__(
+        self, store: AbstractFeatureFlagStore, compile_flags: bool = False
+    ) -> None:
         self._store = store
+        self._compile_flags = compile_flags
         self._event_emitter = FlipperEventEmitter()  # type: IEventEmitter
 
     def get_events(self) -> IEventEmitter:
@@ -72,8 +66,25 @@ class FeatureFlagClient:
         item = self._store.get(feature_name)
         if item is None:
             return default
+        if self._compile_flags:
+            return item.compile()(**conditions)
         return item.is_enabled(**conditions)
 
+    def is_enabled_many(
+        self, feature_names: Iterable[str], default=False, **conditions
+    ) -> Dict[str, bool]:
+        items = self._store.get_many(feature_names)
+
+        results = {}
+        for feature_name, item in items.items():
+            if item is None:
+                results[feature_name] = default
+            elif self._compile_flags:
+                results[feature_name] = item.compile()(**conditions)
+            else:
+                results[feature_name] = item.is_enabled(**conditions)
+        return results
+
     def exists(self, feature_name: str):
         return self._store.get(feature_name) is not None
 
@@ -86,44 +97,57 @@ class FeatureFlagClient:
         for item in self._store.list(limit=limit, offset=offset):
             yield self.get(item.feature_name)
 
-    @flag_must_exist
+    def _get_existing(self, feature_name: str) -> FeatureFlagStoreItem:
+        """
+        Fetch the item once so that the existence check, the meta mutation and
+        the write performed by the store all work off of the same copy.
+        """
+        item = self._store.get(feature_name)
+        if item is None:
+            raise FlagDoesNotExistError()
+        return item
+
     def enable(self, feature_name: str):
+        existing = self._get_existing(feature_name)
+
         self._event_emitter.emit(EventType.PRE_ENABLE, feature_name)
-        self._store.set(feature_name, True)
+        self._store.set(feature_name, True, existing=existing)
         self._event_emitter.emit(EventType.POST_ENABLE, feature_name)
 
-    @flag_must_exist
     def disable(self, feature_name: str):
+        existing = self._get_existing(feature_name)
+
         self._event_emitter.emit(EventType.PRE_DISABLE, feature_name)
-        self._store.set(feature_name, False)
+        self._store.set(feature_name, False, existing=existing)
         self._event_emitter.emit(EventType.POST_DISABLE, feature_name)
 
-    @flag_must_exist
     def destroy(self, feature_name: str):
+        self._get_existing(feature_name)
+
         self._event_emitter.emit(EventType.PRE_DESTROY, feature_name)
         self._store.delete(feature_name)
         self._event_emitter.emit(EventType.POST_DESTROY, feature_name)
 
-    @flag_must_exist
     def add_condition(self, feature_name: str, condition: Condition):
-        meta = FeatureFlagStoreMeta.from_dict(self.get_meta(feature_name))
+        existing = self._get_existing(feature_name)
+        meta = FeatureFlagStoreMeta.from_dict(existing.meta)
 
         meta.conditions.append(condition)
 
         self._event_emitter.emit(EventType.PRE_ADD_CONDITION, feature_name, condition)
-        self._store.set_meta(feature_name, meta)
+        self._store.set_meta(feature_name, meta, existing=existing)
         self._event_emitter.emit(EventType.POST_ADD_CONDITION, feature_name, condition)
 
-    @flag_must_exist
     def set_client_data(self, feature_name: str, client_data: dict):
-        meta = FeatureFlagStoreMeta.from_dict(self.get_meta(feature_name))
+        existing = self._get_existing(feature_name)
+        meta = FeatureFlagStoreMeta.from_dict(existing.meta)
 
         meta.update(client_data=client_data)
 
         self._event_emitter.emit(
             EventType.PRE_SET_CLIENT_DATA, feature_name, meta.client_data
         )
-        self._store.set_meta(feature_name, meta)
+        self._store.set_meta(feature_name, meta, existing=existing)
         self._event_emitter.emit(
             EventType.POST_SET_CLIENT_DATA, feature_name, meta.client_data
         )
@@ -131,33 +155,32 @@ class FeatureFlagClient:
     def get_client_data(self, feature_name: str) -> dict:
         return self.get_meta(feature_name)["client_data"]
 
-    @flag_must_exist
     def get_meta(self, feature_name: str) -> dict:
-        return cast(FeatureFlagStoreItem, self._store.get(feature_name)).meta
+        return self._get_existing(feature_name).meta
 
-    @flag_must_exist
     def set_bucketer(self, feature_name: str, bucketer: AbstractBucketer):
-        meta = FeatureFlagStoreMeta.from_dict(self.get_meta(feature_name))
+        existing = self._get_existing(feature_name)
+        meta = FeatureFlagStoreMeta.from_dict(existing.meta)
 
         meta.update(bucketer=bucketer)
 
         self._event_emitter.emit(EventType.PRE_SET_BUCKETER, feature_name, bucketer)
-        self._store.set_meta(feature_name, meta)
+        self._store.set_meta(feature_name, meta, existing=existing)
         self._event_emitter.emit(EventType.POST_SET_BUCKETER, feature_name, bucketer)
 
-    @flag_must_exist
     def set_conditions(self, feature_name: str, conditions: Iterable[Condition]):
         """
         This method will set the conditions to the feature flag.
         Contrary to `add_conditions` it will not append the condition, but will
         update the whole condition set the the new values provided.
         """
-        meta = FeatureFlagStoreMeta.from_dict(self.get_meta(feature_name))
+        existing = self._get_existing(feature_name)
+        meta = FeatureFlagStoreMeta.from_dict(existing.meta)
 
         meta.conditions = list(conditions)
 
         self._event_emitter.emit(EventType.PRE_SET_CONDITIONS, feature_name, conditions)
-        self._store.set_meta(feature_name, meta)
+        self._store.set_meta(feature_name, meta, existing=existing)
         self._event_emitter.emit(
             EventType.POST_SET_CONDITIONS, feature_name, conditions
         )
@@ -13,7 +13,7 @@
 
 import copy
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from .check import Check
 
@@ -42,6 +42,27 @@ class Condition:
                     return False
         return True
 
+    def compile(self) -> Callable[..., bool]:
+        """
+        Returns a callable equivalent to `check`, with the operators and expected
+        values of every check resolved up front.
+        """
+        compiled = {
+            variable: tuple((c.operator.compare, c.value) for c in checkers)
+            for variable, checkers in self._checks.items()
+            if len(checkers) > 0
+        }
+        get_checkers = compiled.get
+
+        def check(**checks) -> bool:
+            for check_name, check_value in checks.items():
+                for compare, expected in get_checkers(check_name, ()):
+                    if compare(check_value, expected) is False:
+                        return False
+            return True
+
+        return check
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             variable: [check.to_dict() for check in checkers]
@@ -15,9 +15,10 @@ from .cached import CachedFeatureFlagStore
 from .consul import ConsulFeatureFlagStore
 from .memory import MemoryFeatureFlagStore
 from .postgresql import PostgreSQLFeatureFlagStore
-from .redis import RedisFeatureFlagStore
+from .redis import RedisFeatureFlagStore, RedisInvalidationSubscriber
 from .replicated import ReplicatedFeatureFlagStore
 from .s3 import S3FeatureFlagStore
+from .snapshot import SnapshotFeatureFlagStore
 from .thrift import ThriftRPCFeatureFlagStore
 
 __all__ = [
@@ -26,7 +27,9 @@ __all__ = [
     "MemoryFeatureFlagStore",
     "PostgreSQLFeatureFlagStore",
     "RedisFeatureFlagStore",
+    "RedisInvalidationSubscriber",
     "ReplicatedFeatureFlagStore",
     "S3FeatureFlagStore",
+    "SnapshotFeatureFlagStore",
     "ThriftRPCFeatureFlagStore",
 ]
@@ -11,31 +11,158 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Iterator, Optional
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, cast
 
 from cachetools import LRUCache, TTLCache
 
 from .interface import AbstractFeatureFlagStore
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_SIZE = 5000
 DEFAULT_TTL = None
+DEFAULT_REFRESH_WORKERS = 4
+DEFAULT_SHARDS = 1
+
+_MISSING = object()
+
+
+def _make_cache(size: int, ttl: Optional[float]):
+    if ttl is not None:
+        return TTLCache(size, ttl)
+    return LRUCache(size)
+
+
+class _Flight:
+    """
+    A fetch from the wrapped store that concurrent misses on the same flag
+    wait on instead of issuing their own.
+    """
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self._done = threading.Event()
+        self._item = None  # type: Optional[FeatureFlagStoreItem]
+        self._error = None  # type: Optional[Exception]
+
+    def land(
+        self,
+        item: Optional[FeatureFlagStoreItem] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self._item = item
+        self._error = error
+        self._done.set()
+
+    def wait(self) -> Optional[FeatureFlagStoreItem]:
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._item
+
+
+class _Shard:
+    """
+    One stripe of the cache: a slice of the main and negative caches, the
+    fetches in flight for its flags, and the lock that guards all of them.
+    """
+
+    def __init__(self, cache: Any, negative_cache: Any) -> None:
+        self.lock = threading.RLock()
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.in_flight = {}  # type: Dict[str, _Flight]
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+
+
+def _shard_size(size: int, shards: int) -> int:
+    return max(-(-size // shards), 1)
 
 
 class CachedFeatureFlagStore(AbstractFeatureFlagStore):
+    """
+    Missing flags are remembered in a separate negative cache, which has its
+    own size and ttl so that lookups of flags that do not exist can be kept
+    for less time than real items. It defaults to the same size and ttl as the
+    main cache; pass negative_size=0 to disable it.
+
+    With stale_while_revalidate, items older than ttl are still returned
+    while a background thread reloads them, at most one reload per flag at a
+    time. Items older than max_staleness (if given) are dropped, so reads of
+    them block on the wrapped store again.
+
+    cachetools caches are not thread-safe, so every access to them happens
+    under a lock. Concurrent misses on the same flag are coalesced into a
+    single fetch from the wrapped store; the other threads wait for its result.
+
+    With shards greater than one, the caches are split into that many stripes
+    keyed by the hash of the flag name, each with its own lock, so threads
+    reading different flags rarely wait on each other. size and negative_size
+    are divided evenly between the stripes, and each stripe evicts on its own.
+    """
+
     def __init__(
         self,
         store: AbstractFeatureFlagStore,
         size: int = DEFAULT_SIZE,
         ttl: Optional[int] = None,
+        negative_size: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        stale_while_revalidate: bool = False,
+        max_staleness: Optional[int] = None,
+        refresh_workers: int = DEFAULT_REFRESH_WORKERS,
+        shards: int = DEFAULT_SHARDS,
     ) -> None:
-        if ttl is not None:
-            self._cache = TTLCache(size, ttl)
-        else:
-            self._cache = LRUCache(size)
+        if stale_while_revalidate and ttl is None:
+            raise ValueError("stale_while_revalidate requires a ttl")
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if negative_size is None:
+            negative_size = size
+        if negative_ttl is None:
+            negative_ttl = ttl
+        cache_ttl = max_staleness if stale_while_revalidate else ttl
+        self._shards = [
+            _Shard(
+                _make_cache(_shard_size(size, shards), cache_ttl),
+                _make_cache(_shard_size(negative_size, shards), negative_ttl),
+            )
+            for _ in range(shards)
+        ]
+        self._negative_size = negative_size
         self._store = store
         self._ttl = ttl
 
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refresh_workers = refresh_workers
+        self._refresh_executor = None  # type: Optional[ThreadPoolExecutor]
+        self._refreshing = set()  # type: Set[str]
+        self._refreshing_lock = threading.Lock()
+
+    def _shard(self, feature_name: str) -> _Shard:
+        return self._shards[hash(feature_name) % len(self._shards)]
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def negative_hits(self) -> int:
+        return sum(shard.negative_hits for shard in self._shards)
+
     def create(
         self,
         feature_name: str,
@@ -45,33 +172,193 @@ class CachedFeatureFlagStore(AbstractFeatureFlagStore):
         item = self._store.create(
             feature_name, is_enabled=is_enabled, client_data=client_data
         )
-        self._cache[feature_name] = item
+        self._put(feature_name, item)
         return item
 
-    def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
+    def _put(self, feature_name: str, item: Optional[FeatureFlagStoreItem]) -> None:
+        shard = self._shard(feature_name)
+        with shard.lock:
+            if item is not None:
+                shard.negative_cache.pop(feature_name, None)
+                shard.cache[feature_name] = (item, time.monotonic())
+                return
+
+            shard.cache.pop(feature_name, None)
+            if self._negative_size > 0:
+                shard.negative_cache[feature_name] = True
+
+    def _get_cached(self, feature_name: str) -> Any:
+        """
+        Returns the cached item, None if the flag is known not to exist, or
+        _MISSING if the wrapped store has to be consulted.
+        """
+        shard = self._shard(feature_name)
+        with shard.lock:
+            try:
+                item, loaded_at = shard.cache[feature_name]
+            except KeyError:
+                pass
+            else:
+                shard.hits += 1
+                if self._is_stale(loaded_at):
+                    self._revalidate(feature_name)
+                return item
+
+            if feature_name in shard.negative_cache:
+                shard.negative_hits += 1
+                return None
+
+            shard.misses += 1
+            return _MISSING
+
+    def _is_stale(self, loaded_at: float) -> bool:
+        if not self._stale_while_revalidate:
+            return False
+        return time.monotonic() - loaded_at >= cast(int, self._ttl)
+
+    def _revalidate(self, feature_name: str) -> None:
+        with self._refreshing_lock:
+            if feature_name in self._refreshing:
+                return
+            self._refreshing.add(feature_name)
+
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers
+                )
+
+        self._refresh_executor.submit(self._refresh, feature_name)
+
+    def _refresh(self, feature_name: str) -> None:
         try:
-            return self._cache[feature_name]
-        except KeyError:
-            pass
+            self._put(feature_name, self._store.get(feature_name))
+        except Exception:
+            logger.exception("Failed to refresh stale flag %s", feature_name)
+        finally:
+            with self._refreshing_lock:
+                self._refreshing.discard(feature_name)
 
-        item = self._store.get(feature_name)
-        self._cache[feature_name] = item
+    def _load(
+        self,
+        feature_names: List[str],
+        fetch: Callable[[List[str]], Dict[str, Optional[FeatureFlagStoreItem]]],
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        """
+        Fetches the given flags from the wrapped store, joining any fetch that
+        is already in flight for a flag instead of starting another one.
+        """
+        flights = {}  # type: Dict[str, _Flight]
+        leading = []  # type: List[str]
 
-        return item
+        for feature_name in feature_names:
+            shard = self._shard(feature_name)
+            with shard.lock:
+                flight = shard.in_flight.get(feature_name)
+                if flight is None:
+                    flight = shard.in_flight[feature_name] = _Flight(shard.generation)
+                    leading.append(feature_name)
+                flights[feature_name] = flight
+
+        if len(leading) > 0:
+            try:
+                items = fetch(leading)
+            except Exception as e:
+                self._land(leading, {}, error=e)
+                raise
+            self._land(leading, items)
+
+        return {feature_name: flight.wait() for feature_name, flight in flights.items()}
+
+    def _land(
+        self,
+        feature_names: List[str],
+        items: Dict[str, Optional[FeatureFlagStoreItem]],
+        error: Optional[Exception] = None,
+    ) -> None:
+        for feature_name in feature_names:
+            shard = self._shard(feature_name)
+            with shard.lock:
+                flight = shard.in_flight.pop(feature_name)
+                # Skip caching a result that was read before an invalidation.
+                if error is None and flight.generation == shard.generation:
+                    self._put(feature_name, items.get(feature_name))
+                flight.land(items.get(feature_name), error=error)
 
-    def set(self, feature_name: str, is_enabled: bool):
+    def _fetch_one(
+        self, feature_names: List[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        [feature_name] = feature_names
+        return {feature_name: self._store.get(feature_name)}
+
+    def invalidate(self, feature_name: str) -> None:
+        """
+        Drops the cached copy of a flag, so the next read goes to the wrapped
+        store.
+        """
+        shard = self._shard(feature_name)
+        with shard.lock:
+            shard.cache.pop(feature_name, None)
+            shard.negative_cache.pop(feature_name, None)
+            shard.generation += 1
+
+    def invalidate_all(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.negative_cache.clear()
+                shard.generation += 1
+
+    def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
+        item = self._get_cached(feature_name)
+        if item is not _MISSING:
+            return item
+
+        return self._load([feature_name], self._fetch_one)[feature_name]
+
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        items = {}  # type: Dict[str, Optional[FeatureFlagStoreItem]]
+        misses = []
+
+        for feature_name in feature_names:
+            item = self._get_cached(feature_name)
+            if item is _MISSING:
+                misses.append(feature_name)
+            else:
+                items[feature_name] = item
+
+        if len(misses) > 0:
+            items.update(self._load(misses, self._store.get_many))
+
+        return items
+
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        # The caller's copy of the item may have been served from this cache, so
+        # it is not forwarded: the backing store must read its own fresh copy.
         self._store.set(feature_name, is_enabled)
-        self._cache[feature_name] = self._store.get(feature_name)
+        self._put(feature_name, self._store.get(feature_name))
 
     def delete(self, feature_name: str):
         self._store.delete(feature_name)
-        self._cache.pop(feature_name, None)
+        self._put(feature_name, None)
 
     def list(
         self, limit: Optional[int] = None, offset: int = 0
     ) -> Iterator[FeatureFlagStoreItem]:
         return self._store.list(limit=limit, offset=offset)
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        # See set() for why ``existing`` is not forwarded.
         self._store.set_meta(feature_name, meta)
-        self._cache[feature_name] = self._store.get(feature_name)
+        self._put(feature_name, self._store.get(feature_name))
@@ -13,7 +13,7 @@
 
 import logging
 import threading
-from typing import Iterator, Optional, Tuple, cast
+from typing import Dict, Iterator, List, Optional
 
 from .interface import AbstractFeatureFlagStore, FlagDoesNotExistError
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
@@ -21,14 +21,40 @@ from .util.date import now
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WAIT = "30s"
+INITIAL_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 60.0
+
 
 class ConsulFeatureFlagStore(AbstractFeatureFlagStore):
-    def __init__(self, consul, base_key="features"):
-        self._cache = {}
+    """
+    Keeps every flag under base_key in memory and follows changes with Consul
+    blocking queries: each read passes the index of the previous response, so
+    Consul holds the request open for up to `wait` until something changes.
+    Only keys whose ModifyIndex changed are deserialized again, and keys that
+    disappear from the response are dropped. Errors are retried with
+    exponential backoff, up to max_backoff seconds between attempts.
+    """
+
+    def __init__(
+        self,
+        consul,
+        base_key="features",
+        wait: str = DEFAULT_WAIT,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        start: bool = True,
+    ):
+        self._cache = {}  # type: Dict[str, FeatureFlagStoreItem]
+        self._modify_indexes = {}  # type: Dict[str, Optional[int]]
         self._consul = consul
         self.base_key = base_key
+        self._wait = wait
+        self._max_backoff = max_backoff
+        self._stopped = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
 
-        self._start()
+        if start:
+            self._start()
 
     def _start(self):
         logger.debug("Spawning a thread to track changes in consul")
@@ -37,27 +63,80 @@ class ConsulFeatureFlagStore(AbstractFeatureFlagStore):
         self._thread.daemon = True
         self._thread.start()
 
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
     def _watch(self):
         index = None
-        while True:
-            index, data = self._consul.kv.get(self.base_key, recurse=True)
-            self._parse_data(data)
+        backoff = INITIAL_BACKOFF
+
+        while not self._stopped.is_set():
+            try:
+                index = self._poll(index)
+            except Exception:
+                logger.exception("Failed to read feature flags from consul")
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+            else:
+                backoff = INITIAL_BACKOFF
+
+    def _poll(self, index: Optional[str]) -> Optional[str]:
+        """
+        Performs one blocking read and applies it to the cache. Returns the
+        index to pass to the next read.
+        """
+        new_index, data = self._consul.kv.get(
+            self.base_key, index=index, wait=self._wait, recurse=True
+        )
 
-    def _parse_data(self, data: Tuple[dict]):
-        if data is None:
-            return
-        for item in data:
-            serialized = item["Value"]
+        if index is not None and new_index == index:
+            return index
+
+        self._parse_data(data)
+
+        # Consul may reset its index, e.g. after a snapshot restore. When it
+        # goes backwards the next read must start from scratch.
+        if new_index is None or (index is not None and int(new_index) < int(index)):
+            return None
+
+        return new_index
+
+    def _parse_data(self, data: Optional[List[dict]]):
+        seen = set()
+
+        for item in data or ():
+            key, serialized = item["Key"], item["Value"]
 
             if serialized is None:
                 continue
 
+            seen.add(key)
+
+            modify_index = item.get("ModifyIndex")
+            previous = self._modify_indexes.get(key)
+            if modify_index is not None and modify_index == previous:
+                continue
+
             deserialized = FeatureFlagStoreItem.deserialize(serialized)
-            self._set_item_in_cache(item["Key"], deserialized)
+            self._set_item_in_cache(key, deserialized)
+            self._modify_indexes[key] = modify_index
+
+        # Only keys consul has reported before can be considered deleted, so a
+        # response that predates a local write does not drop the new flag.
+        for key in list(self._modify_indexes):
+            if key not in seen:
+                self._remove_item_from_cache(key)
 
     def _set_item_in_cache(self, key: str, item: FeatureFlagStoreItem):
         self._cache[key] = item
 
+    def _remove_item_from_cache(self, key: str):
+        self._cache.pop(key, None)
+        self._modify_indexes.pop(key, None)
+
     def create(
         self,
         feature_name: str,
@@ -72,7 +151,7 @@ class ConsulFeatureFlagStore(AbstractFeatureFlagStore):
     def _save(self, item: FeatureFlagStoreItem) -> FeatureFlagStoreItem:
         self._consul.kv.put(self._make_key(item.feature_name), item.serialize())
 
-        self._set_item_in_cache(item.feature_name, item)
+        self._set_item_in_cache(self._make_key(item.feature_name), item)
 
         return item
 
@@ -82,8 +161,14 @@ class ConsulFeatureFlagStore(AbstractFeatureFlagStore):
     def _make_key(self, feature_name: str) -> str:
         return "/".join([self.base_key, feature_name])
 
-    def set(self, feature_name: str, is_enabled: bool):
-        existing = self.get(feature_name)
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             self.create(feature_name, is_enabled)
@@ -97,20 +182,29 @@ class ConsulFeatureFlagStore(AbstractFeatureFlagStore):
 
     def delete(self, feature_name: str):
         self._consul.kv.delete(self._make_key(feature_name))
+        self._remove_item_from_cache(self._make_key(feature_name))
 
     def list(
         self, limit: Optional[int] = None, offset: int = 0
     ) -> Iterator[FeatureFlagStoreItem]:
-        feature_names = sorted(self._cache.keys())[offset:]
+        keys = sorted(self._cache.keys())[offset:]
 
         if limit is not None:
-            feature_names = feature_names[:limit]
+            keys = keys[:limit]
 
-        for feature_name in feature_names:
-            yield cast(FeatureFlagStoreItem, self.get(feature_name))
+        for key in keys:
+            item = self._cache.get(key)
+            if item is not None:
+                yield item
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
-        existing = self.get(feature_name)
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             raise FlagDoesNotExistError(
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 
 from abc import ABCMeta, abstractmethod
-from typing import Iterator, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
 
@@ -31,8 +31,22 @@ class AbstractFeatureFlagStore(metaclass=ABCMeta):
     def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
         pass
 
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        """
+        Fetch several items at once. Stores that can read many keys in a single
+        round trip should override this; the default falls back to `get`.
+        """
+        return {feature_name: self.get(feature_name) for feature_name in feature_names}
+
     @abstractmethod
-    def set(self, feature_name: str, is_enabled: bool):
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
         pass
 
     @abstractmethod
@@ -46,7 +60,12 @@ class AbstractFeatureFlagStore(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
         pass
 
 
@@ -40,8 +40,14 @@ class MemoryFeatureFlagStore(AbstractFeatureFlagStore):
     def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
         return self._memory.get(feature_name)
 
-    def set(self, feature_name: str, is_enabled: bool):
-        existing = self.get(feature_name)
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             self.create(feature_name, is_enabled)
@@ -67,8 +73,14 @@ class MemoryFeatureFlagStore(AbstractFeatureFlagStore):
         for feature_name in feature_names:
             yield cast(FeatureFlagStoreItem, self.get(feature_name))
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
-        existing = self.get(feature_name)
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             raise FlagDoesNotExistError(
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 from .interface import AbstractFeatureFlagStore, FlagDoesNotExistError
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
@@ -35,6 +35,7 @@ CREATE_ITEM_SQL = (
 DELETE_ITEM_SQL = "DELETE FROM {} WHERE {} = %s"
 LIST_ITEMS_SQL = "SELECT {} FROM {} LIMIT {} OFFSET {}"
 SELECT_ITEM_SQL = "SELECT {} FROM {} WHERE {} = %s"
+SELECT_ITEMS_SQL = "SELECT {}, {} FROM {} WHERE {} = ANY(%s)"
 UPDATE_ITEM_SQL = "UPDATE {} SET {} = %s WHERE {} = %s"
 
 
@@ -121,8 +122,37 @@ class PostgreSQLFeatureFlagStore(AbstractFeatureFlagStore):
             return None
         return FeatureFlagStoreItem.deserialize(bytes(row[0]))
 
-    def set(self, feature_name: str, is_enabled: bool) -> None:
-        existing = self.get(feature_name)
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        names = list(feature_names)
+        items = dict.fromkeys(names)  # type: Dict[str, Optional[FeatureFlagStoreItem]]
+
+        if len(names) == 0:
+            return items
+
+        with self._connection() as conn:
+            query = sql.SQL(SELECT_ITEMS_SQL).format(
+                self._name_column,
+                self._item_column,
+                self._table_name,
+                self._name_column,
+            )
+            rows = conn.execute(query, (names,)).fetchall()
+
+        for name, serialized in rows:
+            items[name] = FeatureFlagStoreItem.deserialize(bytes(serialized))
+
+        return items
+
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ) -> None:
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             self.create(feature_name, is_enabled)
@@ -147,8 +177,14 @@ class PostgreSQLFeatureFlagStore(AbstractFeatureFlagStore):
         for row in rows:
             yield FeatureFlagStoreItem.deserialize(bytes(row[0]))
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta) -> None:
-        existing = self.get(feature_name)
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ) -> None:
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             raise FlagDoesNotExistError(f"Feature {feature_name} does not exist")
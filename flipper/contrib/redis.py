@@ -11,7 +11,9 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Iterator, Optional
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from redis import Redis
 
@@ -20,19 +22,32 @@ from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
 from .util.date import now
 from .util.iter import batchify
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_LIST_METHOD_BATCH_SIZE = 100
+DEFAULT_POLL_TIMEOUT = 1.0
+INITIAL_RECONNECT_DELAY = 0.5
+DEFAULT_MAX_RECONNECT_DELAY = 30.0
 
 
 class RedisFeatureFlagStore(AbstractFeatureFlagStore):
+    """
+    If invalidation_channel is given, the name of every flag that is written
+    or deleted is published on that channel, so that a
+    RedisInvalidationSubscriber in each process can drop its cached copy.
+    """
+
     def __init__(
         self,
         redis: Redis,
         base_key: str = "features",
         list_method_batch_size: int = DEFAULT_LIST_METHOD_BATCH_SIZE,
+        invalidation_channel: Optional[str] = None,
     ) -> None:
         self._redis = redis
         self.base_key = base_key
         self.list_method_batch_size = list_method_batch_size
+        self.invalidation_channel = invalidation_channel
 
     def create(
         self,
@@ -47,19 +62,46 @@ class RedisFeatureFlagStore(AbstractFeatureFlagStore):
 
     def _save(self, item: FeatureFlagStoreItem) -> FeatureFlagStoreItem:
         self._redis.set(self._key_name(item.feature_name), item.serialize())
+        self._publish_invalidation(item.feature_name)
         return item
 
+    def _publish_invalidation(self, feature_name: str) -> None:
+        if self.invalidation_channel is not None:
+            self._redis.publish(self.invalidation_channel, feature_name)
+
     def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
         serialized = self._redis.get(self._key_name(feature_name))
         if not serialized:
             return None
         return FeatureFlagStoreItem.deserialize(serialized)
 
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        items = {}  # type: Dict[str, Optional[FeatureFlagStoreItem]]
+
+        for batch in batchify(feature_names, self.list_method_batch_size):
+            results = self._redis.mget([self._key_name(name) for name in batch])
+
+            for feature_name, serialized in zip(batch, results):
+                if not serialized:
+                    items[feature_name] = None
+                else:
+                    items[feature_name] = FeatureFlagStoreItem.deserialize(serialized)
+
+        return items
+
     def _key_name(self, feature_name: str) -> str:
         return "/".join([self.base_key, feature_name])
 
-    def set(self, feature_name: str, is_enabled: bool):
-        existing = self.get(feature_name)
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             self.create(feature_name, is_enabled)
@@ -105,8 +147,14 @@ class RedisFeatureFlagStore(AbstractFeatureFlagStore):
     def _make_scan_wildcard_match(self) -> str:
         return "%s/*" % self.base_key
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
-        existing = self.get(feature_name)
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             raise FlagDoesNotExistError(
@@ -119,3 +167,100 @@ class RedisFeatureFlagStore(AbstractFeatureFlagStore):
 
     def delete(self, feature_name: str):
         self._redis.delete(self._key_name(feature_name))
+        self._publish_invalidation(feature_name)
+
+
+class RedisInvalidationSubscriber:
+    """
+    Listens on the invalidation channel of a RedisFeatureFlagStore and calls
+    invalidate(feature_name) on each of the given caches for every message.
+
+    Pub/sub delivery is at most once, so messages published while the
+    subscription is down are lost. After reconnecting, the subscriber calls
+    invalidate_all() on every cache to drop anything that may have changed in
+    the meantime.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        channel: str,
+        caches: List,
+        poll_timeout: float = DEFAULT_POLL_TIMEOUT,
+        max_reconnect_delay: float = DEFAULT_MAX_RECONNECT_DELAY,
+        start: bool = True,
+    ) -> None:
+        self._redis = redis
+        self._channel = channel
+        self._caches = caches
+        self._poll_timeout = poll_timeout
+        self._max_reconnect_delay = max_reconnect_delay
+        self._stopped = threading.Event()
+        self._subscribed = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        logger.debug("Spawning a thread to listen for flag invalidations")
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wait_until_subscribed(self, timeout: Optional[float] = None) -> bool:
+        return self._subscribed.wait(timeout)
+
+    def _run(self) -> None:
+        delay = INITIAL_RECONNECT_DELAY
+        reconnecting = False
+
+        while not self._stopped.is_set():
+            try:
+                self._listen(reconnecting)
+            except Exception:
+                logger.exception("Lost the flag invalidation subscription")
+                if self._subscribed.is_set():
+                    delay = INITIAL_RECONNECT_DELAY
+                self._subscribed.clear()
+                reconnecting = True
+                self._stopped.wait(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+            else:
+                return
+
+    def _listen(self, reconnecting: bool) -> None:
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self._channel)
+            if reconnecting:
+                self._invalidate_all()
+            self._subscribed.set()
+
+            while not self._stopped.is_set():
+                message = pubsub.get_message(timeout=self._poll_timeout)
+                if message is not None:
+                    self._invalidate(message["data"])
+        finally:
+            pubsub.close()
+
+    def _invalidate(self, data) -> None:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        for cache in self._caches:
+            cache.invalidate(data)
+
+    def _invalidate_all(self) -> None:
+        for cache in self._caches:
+            cache.invalidate_all()
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 
 from threading import Thread
-from typing import Callable, Dict, Iterator, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 from .interface import AbstractFeatureFlagStore
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
@@ -77,15 +77,24 @@ class ReplicatedFeatureFlagStore(AbstractFeatureFlagStore):
     def get(self, *args, **kwargs) -> Optional[FeatureFlagStoreItem]:
         return self._primary.get(*args, **kwargs)
 
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        return self._primary.get_many(feature_names)
+
     def set(
-        self, feature_name: str, is_enabled: bool, asynch: Optional[bool] = True
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        asynch: Optional[bool] = True,
+        existing: Optional[FeatureFlagStoreItem] = None,
     ) -> None:
         def perform_set_on_store(store, *args, **kwargs):
             store.set(*args, **kwargs)
 
         args = (feature_name, is_enabled)
 
-        perform_set_on_store(self._primary, *args)
+        perform_set_on_store(self._primary, *args, **self._existing_kwargs(existing))
 
         self._replicate(perform_set_on_store, asynch=asynch, args=args)
 
@@ -105,12 +114,22 @@ class ReplicatedFeatureFlagStore(AbstractFeatureFlagStore):
         feature_name: str,
         meta: FeatureFlagStoreMeta,
         asynch: Optional[bool] = True,
+        existing: Optional[FeatureFlagStoreItem] = None,
     ) -> None:
         def perform_set_meta_on_store(store, *args, **kwargs):
             store.set_meta(*args, **kwargs)
 
         args = (feature_name, meta)
 
-        perform_set_meta_on_store(self._primary, *args)
+        perform_set_meta_on_store(
+            self._primary, *args, **self._existing_kwargs(existing)
+        )
 
         self._replicate(perform_set_meta_on_store, asynch=asynch, args=args)
+
+    def _existing_kwargs(self, existing: Optional[FeatureFlagStoreItem]) -> Dict:
+        # The prefetched item was read from the primary, so replicas always
+        # perform their own read.
+        if existing is None:
+            return {}
+        return {"existing": existing}
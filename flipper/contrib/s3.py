@@ -11,20 +11,28 @@
 # CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Iterator, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, cast
 
 from .interface import AbstractFeatureFlagStore, FlagDoesNotExistError
 from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
 from .util.date import now
 
+DEFAULT_MAX_WORKERS = 10
+
 
 class S3FeatureFlagStore(AbstractFeatureFlagStore):
     def __init__(
-        self, client, bucket_name: str, page_size: Optional[int] = 1000
+        self,
+        client,
+        bucket_name: str,
+        page_size: Optional[int] = 1000,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         self._client = client
         self._bucket_name = bucket_name
         self._page_size = page_size
+        self._max_workers = max_workers
 
     def create(
         self,
@@ -53,8 +61,25 @@ class S3FeatureFlagStore(AbstractFeatureFlagStore):
         serialized = response["Body"].read()
         return FeatureFlagStoreItem.deserialize(serialized)
 
-    def set(self, feature_name: str, is_enabled: bool):
-        existing = self.get(feature_name)
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        names = list(feature_names)
+
+        if len(names) == 0:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return dict(zip(names, executor.map(self.get, names)))
+
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             self.create(feature_name, is_enabled)
@@ -96,8 +121,14 @@ class S3FeatureFlagStore(AbstractFeatureFlagStore):
     ) -> bool:
         return limit is not None and visited > limit + offset
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta) -> None:
-        existing = self.get(feature_name)
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ) -> None:
+        if existing is None:
+            existing = self.get(feature_name)
 
         if existing is None:
             raise FlagDoesNotExistError("Feature %s does not exist" % feature_name)
@@ -0,0 +1,205 @@
+# Copyright 2018 eShares, Inc. dba Carta, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Optional
+
+from .interface import AbstractFeatureFlagStore
+from .storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 30
+
+
+class SnapshotFeatureFlagStore(AbstractFeatureFlagStore):
+    """
+    Keeps the whole flag set of the wrapped store in memory. The snapshot is
+    loaded with `list()` on startup and reloaded on a background thread every
+    `refresh_interval` seconds. Each reload builds a new immutable mapping and
+    swaps the reference, so reads never lock and never touch the network.
+
+    If the first load fails the error is raised, unless `fallback` items are
+    given, in which case the store starts from those and keeps retrying in the
+    background.
+    """
+
+    def __init__(
+        self,
+        store: AbstractFeatureFlagStore,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        fallback: Optional[Iterable[FeatureFlagStoreItem]] = None,
+        start: bool = True,
+    ) -> None:
+        self._store = store
+        self._refresh_interval = refresh_interval
+        self._snapshot = MappingProxyType({})  # type: MappingProxyType
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+        self.refresh_count = 0
+        self.refresh_failure_count = 0
+        self.last_refresh_error = None  # type: Optional[Exception]
+        self._last_refreshed_at = None  # type: Optional[float]
+
+        self._load_initial_snapshot(fallback)
+
+        if start:
+            self.start()
+
+    def _load_initial_snapshot(
+        self, fallback: Optional[Iterable[FeatureFlagStoreItem]]
+    ) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            if fallback is None:
+                raise
+            logger.exception("Initial snapshot load failed, using fallback items")
+            self._swap({item.feature_name: item for item in fallback})
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        logger.debug("Spawning a thread to refresh the flag snapshot")
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh the flag snapshot")
+
+    def refresh(self) -> None:
+        try:
+            items = {item.feature_name: item for item in self._store.list()}
+        except Exception as e:
+            self.refresh_failure_count += 1
+            self.last_refresh_error = e
+            raise
+
+        self._swap(items)
+
+        self.refresh_count += 1
+        self.last_refresh_error = None
+        self._last_refreshed_at = time.monotonic()
+
+    def _swap(self, items: Dict[str, FeatureFlagStoreItem]) -> None:
+        with self._write_lock:
+            self._snapshot = MappingProxyType(items)
+
+    def _replace_item(
+        self, feature_name: str, item: Optional[FeatureFlagStoreItem]
+    ) -> None:
+        with self._write_lock:
+            items = dict(self._snapshot)
+            if item is None:
+                items.pop(feature_name, None)
+            else:
+                items[feature_name] = item
+            self._snapshot = MappingProxyType(items)
+
+    def invalidate(self, feature_name: str) -> None:
+        """
+        Reloads a single flag from the wrapped store without waiting for the
+        next refresh.
+        """
+        self._replace_item(feature_name, self._store.get(feature_name))
+
+    def invalidate_all(self) -> None:
+        self.refresh()
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """
+        Seconds since the snapshot was last loaded from the wrapped store, or
+        None if it has never been loaded successfully.
+        """
+        if self._last_refreshed_at is None:
+            return None
+        return time.monotonic() - self._last_refreshed_at
+
+    def create(
+        self,
+        feature_name: str,
+        is_enabled: bool = False,
+        client_data: Optional[dict] = None,
+    ) -> FeatureFlagStoreItem:
+        item = self._store.create(
+            feature_name, is_enabled=is_enabled, client_data=client_data
+        )
+        self._replace_item(feature_name, item)
+        return item
+
+    def get(self, feature_name: str) -> Optional[FeatureFlagStoreItem]:
+        return self._snapshot.get(feature_name)
+
+    def get_many(
+        self, feature_names: Iterable[str]
+    ) -> Dict[str, Optional[FeatureFlagStoreItem]]:
+        snapshot = self._snapshot
+        return {
+            feature_name: snapshot.get(feature_name) for feature_name in feature_names
+        }
+
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        # Like the cached store, the snapshot copy may be stale so the wrapped
+        # store performs its own read.
+        self._store.set(feature_name, is_enabled)
+        self._replace_item(feature_name, self._store.get(feature_name))
+
+    def delete(self, feature_name: str):
+        self._store.delete(feature_name)
+        self._replace_item(feature_name, None)
+
+    def list(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[FeatureFlagStoreItem]:
+        snapshot = self._snapshot
+        feature_names = sorted(snapshot.keys())[offset:]
+
+        if limit is not None:
+            feature_names = feature_names[:limit]
+
+        for feature_name in feature_names:
+            yield snapshot[feature_name]
+
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
+        self._store.set_meta(feature_name, meta)
+        self._replace_item(feature_name, self._store.get(feature_name))
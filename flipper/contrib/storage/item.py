@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 
 import json
+from typing import Callable, Optional
 
 from flipper.bucketing import NoOpBucketer
 
@@ -25,6 +26,7 @@ class FeatureFlagStoreItem:
         self.feature_name = feature_name
         self._is_enabled = is_enabled
         self._meta = meta
+        self._compiled = None  # type: Optional[Callable[..., bool]]
 
     def to_dict(self):
         return {
@@ -62,6 +64,47 @@ class FeatureFlagStoreItem:
 
         return True
 
+    def compile(self) -> Callable[..., bool]:
+        """
+        Returns a callable equivalent to `is_enabled`. The evaluator is built the
+        first time this is called and cached on the item afterwards.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+
+    def _compile(self) -> Callable[..., bool]:
+        if self._is_enabled is False:
+            return _always_false
+
+        checks = tuple(condition.compile() for condition in self._meta.conditions)
+        bucketer_check = self._meta.bucketer.check if self._has_bucketer() else None
+
+        if len(checks) == 0:
+            return bucketer_check or _always_true
+
+        def all_conditions_satisfied(conditions: dict) -> bool:
+            for check in checks:
+                if not check(**conditions):
+                    return False
+            return True
+
+        if bucketer_check is None:
+
+            def is_enabled(**conditions) -> bool:
+                if len(conditions):
+                    return all_conditions_satisfied(conditions)
+                return True
+
+        else:
+
+            def is_enabled(**conditions) -> bool:
+                if len(conditions):
+                    return all_conditions_satisfied(conditions)
+                return bucketer_check()
+
+        return is_enabled
+
     def _all_conditions_satisfied(self, **conditions) -> bool:
         return all(c.check(**conditions) for c in self._meta.conditions)
 
@@ -74,3 +117,11 @@ class FeatureFlagStoreItem:
     @property
     def meta(self):
         return self._meta.to_dict()
+
+
+def _always_true(**conditions) -> bool:
+    return True
+
+
+def _always_false(**conditions) -> bool:
+    return False
@@ -96,7 +96,12 @@ class ThriftRPCFeatureFlagStore(AbstractFeatureFlagStore):
     def _convert_thrift_to_bucketer(self, bucketer: str) -> AbstractBucketer:
         return BucketerFactory.create(json.loads(bucketer))
 
-    def set(self, feature_name: str, is_enabled: bool):
+    def set(
+        self,
+        feature_name: str,
+        is_enabled: bool,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
         return self._client.Set(feature_name, is_enabled)
 
     def delete(self, feature_name: str):
@@ -110,7 +115,12 @@ class ThriftRPCFeatureFlagStore(AbstractFeatureFlagStore):
             for item in self._client.List(limit, offset)
         )
 
-    def set_meta(self, feature_name: str, meta: FeatureFlagStoreMeta):
+    def set_meta(
+        self,
+        feature_name: str,
+        meta: FeatureFlagStoreMeta,
+        existing: Optional[FeatureFlagStoreItem] = None,
+    ):
         try:
             self._client.SetMeta(feature_name, self._convert_meta_to_tmeta(meta))
         except self._ttypes.FlipperException as e:
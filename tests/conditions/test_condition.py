@@ -212,3 +212,25 @@ class TestFromDict(BaseTest):
         for key, checks in expected.items():
             for check in checks:
                 self.assertTrue(check in actual[key])
+
+
+class TestCompile(BaseTest):
+    def test_returns_true_when_all_checks_are_met(self):
+        condition = Condition(foo=True, bar__gt=5, baz__in=[1, 2])
+
+        self.assertTrue(condition.compile()(foo=True, bar=6, baz=2))
+
+    def test_returns_false_when_at_least_one_check_is_not_met(self):
+        condition = Condition(foo=True, bar__gt=5, baz__in=[1, 2])
+
+        self.assertFalse(condition.compile()(foo=True, bar=6, baz=3))
+
+    def test_applies_every_check_on_the_same_variable(self):
+        condition = Condition(foo__gt=5, foo__lt=10)
+
+        self.assertFalse(condition.compile()(foo=11))
+
+    def test_ignores_values_without_checks(self):
+        condition = Condition(foo=True)
+
+        self.assertTrue(condition.compile()(foo=True, bar=self.txt()))
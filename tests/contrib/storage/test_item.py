@@ -193,3 +193,60 @@ class TestIsEnabled(BaseTest):
         meta = FeatureFlagStoreMeta(self.now, bucketer=bucketer, conditions=[condition])
         item = FeatureFlagStoreItem(self.txt(), True, meta)
         self.assertFalse(item.is_enabled(is_admin=False))
+
+
+class TestCompile(BaseTest):
+    def test_is_true_when_enabled(self):
+        meta = FeatureFlagStoreMeta(self.now, {})
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertTrue(item.compile()())
+
+    def test_is_false_when_disabled(self):
+        meta = FeatureFlagStoreMeta(self.now, conditions=[Condition(foo=True)])
+        item = FeatureFlagStoreItem(self.txt(), False, meta)
+        self.assertFalse(item.compile()(foo=True))
+
+    def test_is_true_if_conditions_are_matched(self):
+        meta = FeatureFlagStoreMeta(self.now, conditions=[Condition(foo=True)])
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertTrue(item.compile()(foo=True))
+
+    def test_is_false_if_one_of_many_conditions_are_not_matched(self):
+        conditions = [Condition(foo=True), Condition(x__lt=10)]
+        meta = FeatureFlagStoreMeta(self.now, conditions=conditions)
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertFalse(item.compile()(foo=True, x=11))
+
+    def test_is_true_if_conditions_are_not_specified(self):
+        meta = FeatureFlagStoreMeta(self.now, conditions=[Condition(foo=True)])
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertTrue(item.compile()())
+
+    def test_forwards_conditions_to_bucketer_when_there_are_no_conditions(self):
+        bucketer = MagicMock()
+        bucketer.check.return_value = False
+        meta = FeatureFlagStoreMeta(self.now, bucketer=bucketer)
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertFalse(item.compile()(user_id=1))
+        bucketer.check.assert_called_once_with(user_id=1)
+
+    def test_returns_bucketer_result_when_conditions_not_specified(self):
+        bucketer = MagicMock()
+        bucketer.check.return_value = False
+        condition = Condition(is_admin=True)
+        meta = FeatureFlagStoreMeta(self.now, bucketer=bucketer, conditions=[condition])
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertFalse(item.compile()())
+
+    def test_conditions_take_precedence_over_bucketer(self):
+        bucketer = MagicMock()
+        bucketer.check.return_value = False
+        condition = Condition(is_admin=True)
+        meta = FeatureFlagStoreMeta(self.now, bucketer=bucketer, conditions=[condition])
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertTrue(item.compile()(is_admin=True))
+
+    def test_is_cached_on_the_item(self):
+        meta = FeatureFlagStoreMeta(self.now, conditions=[Condition(foo=True)])
+        item = FeatureFlagStoreItem(self.txt(), True, meta)
+        self.assertIs(item.compile(), item.compile())
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from datetime import datetime
 from time import sleep
@@ -129,8 +130,8 @@ class TestGet(BaseTest):
             def __setitem__(self, key, value):
                 self.wrapped[key] = value
 
-        cache = fast._cache
-        fast._cache = CacheWrapper(cache)
+        [shard] = fast._shards
+        shard.cache = CacheWrapper(shard.cache)
 
         fast.set(feature_name, 1)
 
@@ -152,6 +153,409 @@ class TestGet(BaseTest):
         slow.get.assert_called_once_with(feature_name)
 
 
+class TestNegativeCache(BaseTest):
+    def test_does_not_call_slow_store_again_for_deleted_flags(self):
+        feature_name = self.txt()
+
+        self.fast.create(feature_name)
+        self.fast.delete(feature_name)
+
+        self.slow.get = MagicMock()
+
+        self.assertIsNone(self.fast.get(feature_name))
+        self.slow.get.assert_not_called()
+
+    def test_create_invalidates_negative_entry(self):
+        feature_name = self.txt()
+
+        self.fast.get(feature_name)
+        self.fast.create(feature_name, is_enabled=True)
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+    def test_negative_entries_expire_after_negative_ttl(self):
+        fast = CachedFeatureFlagStore(self.slow, negative_ttl=0.01)
+        feature_name = self.txt()
+
+        fast.get(feature_name)
+        self.slow.create(feature_name)
+        sleep(0.02)
+
+        self.assertIsNotNone(fast.get(feature_name))
+
+    def test_negative_ttl_does_not_affect_positive_entries(self):
+        fast = CachedFeatureFlagStore(self.slow, negative_ttl=0.01)
+        feature_name = self.txt()
+
+        fast.create(feature_name)
+        sleep(0.02)
+        self.slow.get = MagicMock()
+
+        fast.get(feature_name)
+
+        self.slow.get.assert_not_called()
+
+    def test_can_be_disabled(self):
+        slow = MagicMock()
+        slow.get.return_value = None
+        fast = CachedFeatureFlagStore(slow, negative_size=0)
+
+        feature_name = self.txt()
+
+        fast.get(feature_name)
+        fast.get(feature_name)
+
+        self.assertEqual(2, slow.get.call_count)
+
+    def test_counts_hits_misses_and_negative_hits(self):
+        existing, missing = self.txt(), self.txt()
+        self.slow.create(existing)
+
+        self.fast.get(existing)
+        self.fast.get(existing)
+        self.fast.get(missing)
+        self.fast.get(missing)
+        self.fast.get(missing)
+
+        self.assertEqual(
+            (1, 2, 2),
+            (self.fast.hits, self.fast.misses, self.fast.negative_hits),
+        )
+
+    def test_get_many_uses_negative_entries(self):
+        feature_name = self.txt()
+
+        self.fast.get(feature_name)
+
+        self.slow.get_many = MagicMock()
+
+        self.assertEqual({feature_name: None}, self.fast.get_many([feature_name]))
+        self.slow.get_many.assert_not_called()
+
+
+class TestStaleWhileRevalidate(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.fast = CachedFeatureFlagStore(
+            self.slow, ttl=0.01, stale_while_revalidate=True
+        )
+
+    def wait_for_refreshes(self):
+        for _ in range(100):
+            if len(self.fast._refreshing) == 0:
+                return
+            sleep(0.01)
+
+    def test_requires_ttl(self):
+        with self.assertRaises(ValueError):
+            CachedFeatureFlagStore(self.slow, stale_while_revalidate=True)
+
+    def test_returns_stale_value_after_ttl_expires(self):
+        feature_name = self.txt()
+
+        self.fast.create(feature_name)
+        self.slow.set(feature_name, True)
+        sleep(0.02)
+
+        self.assertFalse(self.fast.get(feature_name).is_enabled())
+
+    def test_refreshes_stale_value_in_the_background(self):
+        feature_name = self.txt()
+
+        self.fast.create(feature_name)
+        self.slow.set(feature_name, True)
+        sleep(0.02)
+
+        self.fast.get(feature_name)
+        self.wait_for_refreshes()
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+    def test_refreshes_each_flag_once_at_a_time(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+        sleep(0.02)
+
+        release = threading.Event()
+        get = self.slow.get
+
+        def slow_get(name):
+            release.wait(1)
+            return get(name)
+
+        self.slow.get = MagicMock(side_effect=slow_get)
+
+        for _ in range(10):
+            self.fast.get(feature_name)
+
+        release.set()
+        self.wait_for_refreshes()
+
+        self.slow.get.assert_called_once_with(feature_name)
+
+    def test_blocks_on_slow_store_after_max_staleness(self):
+        fast = CachedFeatureFlagStore(
+            self.slow, ttl=0.01, stale_while_revalidate=True, max_staleness=0.02
+        )
+        feature_name = self.txt()
+
+        fast.create(feature_name)
+        self.slow.set(feature_name, True)
+        sleep(0.03)
+
+        self.assertTrue(fast.get(feature_name).is_enabled())
+
+
+class TestConcurrentMisses(BaseTest):
+    def block_slow_get(self):
+        release = threading.Event()
+        get = self.slow.get
+
+        def slow_get(name):
+            release.wait(1)
+            return get(name)
+
+        self.slow.get = MagicMock(side_effect=slow_get)
+        return release
+
+    def run_in_threads(self, fn, count=10):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(fn())) for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def in_flight(self):
+        return {
+            feature_name: flight
+            for shard in self.fast._shards
+            for feature_name, flight in shard.in_flight.items()
+        }
+
+    def wait_for_in_flight(self, feature_name):
+        for _ in range(100):
+            if feature_name in self.in_flight():
+                return
+            sleep(0.01)
+
+    def test_coalesces_concurrent_misses_into_one_fetch(self):
+        feature_name = self.txt()
+        self.slow.create(feature_name, is_enabled=True)
+        release = self.block_slow_get()
+
+        threads, results = self.run_in_threads(lambda: self.fast.get(feature_name))
+        self.wait_for_in_flight(feature_name)
+        sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.slow.get.assert_called_once_with(feature_name)
+        self.assertTrue(all(item.is_enabled() for item in results))
+        self.assertEqual(10, len(results))
+
+    def test_forgets_fetches_once_they_complete(self):
+        feature_name = self.txt()
+
+        self.fast.get(feature_name)
+
+        self.assertEqual({}, self.in_flight())
+
+    def test_propagates_errors_to_every_waiting_thread(self):
+        feature_name = self.txt()
+        release = threading.Event()
+
+        def failing_get(name):
+            release.wait(1)
+            raise ConnectionError
+
+        self.slow.get = MagicMock(side_effect=failing_get)
+
+        def get():
+            try:
+                self.fast.get(feature_name)
+            except ConnectionError as e:
+                return e
+
+        threads, errors = self.run_in_threads(get, count=5)
+        self.wait_for_in_flight(feature_name)
+        sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(5, len([e for e in errors if isinstance(e, ConnectionError)]))
+        self.assertEqual({}, self.in_flight())
+
+    def test_survives_concurrent_access_to_a_small_cache(self):
+        fast = CachedFeatureFlagStore(self.slow, size=4)
+        feature_names = [self.txt() for _ in range(20)]
+        for feature_name in feature_names:
+            self.slow.create(feature_name)
+
+        def hammer():
+            for _ in range(50):
+                for feature_name in feature_names:
+                    fast.get(feature_name)
+            return True
+
+        threads, results = self.run_in_threads(hammer, count=8)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([True] * 8, results)
+
+
+class TestShards(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.fast = CachedFeatureFlagStore(self.slow, size=64, shards=8)
+
+    def test_requires_at_least_one_shard(self):
+        with self.assertRaises(ValueError):
+            CachedFeatureFlagStore(self.slow, shards=0)
+
+    def test_divides_size_between_shards(self):
+        self.assertEqual([8] * 8, [shard.cache.maxsize for shard in self.fast._shards])
+
+    def test_spreads_flags_across_shards(self):
+        for _ in range(64):
+            self.fast.create(self.txt())
+
+        populated = [shard for shard in self.fast._shards if len(shard.cache) > 0]
+
+        self.assertGreater(len(populated), 1)
+
+    def test_serves_cached_items_without_reading_the_wrapped_store(self):
+        feature_names = [self.txt() for _ in range(16)]
+        for feature_name in feature_names:
+            self.fast.create(feature_name, is_enabled=True)
+
+        self.slow.get = MagicMock()
+
+        for feature_name in feature_names:
+            self.assertTrue(self.fast.get(feature_name).is_enabled())
+        self.slow.get.assert_not_called()
+
+    def test_sums_counters_across_shards(self):
+        feature_names = [self.txt() for _ in range(16)]
+        for feature_name in feature_names:
+            self.slow.create(feature_name)
+
+        for feature_name in feature_names:
+            self.fast.get(feature_name)
+            self.fast.get(feature_name)
+
+        self.assertEqual((16, 16), (self.fast.hits, self.fast.misses))
+
+    def test_survives_concurrent_access(self):
+        feature_names = [self.txt() for _ in range(100)]
+        for feature_name in feature_names:
+            self.slow.create(feature_name)
+
+        results = []
+
+        def hammer():
+            for _ in range(20):
+                for feature_name in feature_names:
+                    self.fast.get(feature_name)
+            results.append(True)
+
+        threads = [threading.Thread(target=hammer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([True] * 8, results)
+
+
+class TestInvalidate(BaseTest):
+    def test_next_read_goes_to_the_wrapped_store(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+        self.slow.set(feature_name, True)
+
+        self.fast.invalidate(feature_name)
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+    def test_drops_negative_entries(self):
+        feature_name = self.txt()
+        self.fast.get(feature_name)
+        self.slow.create(feature_name)
+
+        self.fast.invalidate(feature_name)
+
+        self.assertIsNotNone(self.fast.get(feature_name))
+
+    def test_invalidate_all_drops_every_entry(self):
+        feature_names = [self.txt() for _ in range(3)]
+        for feature_name in feature_names:
+            self.fast.create(feature_name)
+            self.slow.set(feature_name, True)
+
+        self.fast.invalidate_all()
+
+        for feature_name in feature_names:
+            self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+    def test_does_not_cache_a_fetch_that_started_before_invalidation(self):
+        feature_name = self.txt()
+        self.slow.create(feature_name)
+        get = self.slow.get
+
+        def get_then_change(name):
+            item = get(name)
+            self.slow.set(name, True, existing=item)
+            self.fast.invalidate(name)
+            return item
+
+        self.slow.get = MagicMock(side_effect=get_then_change)
+
+        self.assertFalse(self.fast.get(feature_name).is_enabled())
+
+        self.slow.get = get
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        enabled, missing = self.txt(), self.txt()
+
+        self.slow.create(enabled, is_enabled=True)
+
+        items = self.fast.get_many([enabled, missing])
+
+        self.assertTrue(items[enabled].is_enabled())
+        self.assertIsNone(items[missing])
+
+    def test_only_forwards_misses_to_slow_store(self):
+        cached, uncached = self.txt(), self.txt()
+
+        self.fast.create(cached)
+        self.slow.create(uncached)
+
+        self.slow.get_many = MagicMock(wraps=self.slow.get_many)
+
+        self.fast.get_many([cached, uncached])
+
+        self.slow.get_many.assert_called_once_with([uncached])
+
+    def test_does_not_call_slow_store_when_everything_is_cached(self):
+        feature_name = self.txt()
+
+        self.fast.create(feature_name)
+
+        self.slow.get_many = MagicMock()
+
+        self.fast.get_many([feature_name])
+
+        self.slow.get_many.assert_not_called()
+
+
 class TestSet(BaseTest):
     def test_sets_value_correctly(self):
         feature_name = self.txt()
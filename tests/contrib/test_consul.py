@@ -0,0 +1,207 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from flipper import ConsulFeatureFlagStore
+from flipper.contrib.storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
+
+
+class BaseTest(unittest.TestCase):
+    def setUp(self):
+        self.consul = MagicMock()
+        self.store = ConsulFeatureFlagStore(self.consul, start=False)
+
+    def txt(self):
+        return uuid4().hex
+
+    def entry(self, feature_name, modify_index, is_enabled=False):
+        item = FeatureFlagStoreItem(
+            feature_name,
+            is_enabled,
+            FeatureFlagStoreMeta(int(datetime(2018, 1, 1).timestamp())),
+        )
+        return {
+            "Key": "features/%s" % feature_name,
+            "Value": item.serialize(),
+            "ModifyIndex": modify_index,
+        }
+
+
+class TestPoll(BaseTest):
+    def test_passes_previous_index_and_wait(self):
+        self.consul.kv.get.return_value = ("12", [])
+
+        self.store._poll("10")
+
+        self.consul.kv.get.assert_called_once_with(
+            "features", index="10", wait="30s", recurse=True
+        )
+
+    def test_returns_the_new_index(self):
+        self.consul.kv.get.return_value = ("12", [])
+
+        self.assertEqual("12", self.store._poll("10"))
+
+    def test_starts_over_when_the_index_goes_backwards(self):
+        self.consul.kv.get.return_value = ("3", [])
+
+        self.assertIsNone(self.store._poll("10"))
+
+    def test_loads_flags(self):
+        feature_name = self.txt()
+        self.consul.kv.get.return_value = (
+            "5",
+            [self.entry(feature_name, 5, is_enabled=True)],
+        )
+
+        self.store._poll(None)
+
+        self.assertTrue(self.store.get(feature_name).is_enabled())
+
+    def test_skips_folder_entries(self):
+        self.consul.kv.get.return_value = (
+            "5",
+            [{"Key": "features/", "Value": None, "ModifyIndex": 1}],
+        )
+
+        self.store._poll(None)
+
+        self.assertEqual([], list(self.store.list()))
+
+    def test_only_deserializes_keys_whose_modify_index_changed(self):
+        unchanged, changed = self.txt(), self.txt()
+        self.consul.kv.get.return_value = (
+            "5",
+            [self.entry(unchanged, 4), self.entry(changed, 5)],
+        )
+        self.store._poll(None)
+
+        self.consul.kv.get.return_value = (
+            "6",
+            [self.entry(unchanged, 4), self.entry(changed, 6, is_enabled=True)],
+        )
+        with patch.object(
+            FeatureFlagStoreItem,
+            "deserialize",
+            wraps=FeatureFlagStoreItem.deserialize,
+        ) as deserialize:
+            self.store._poll("5")
+
+        self.assertEqual(1, deserialize.call_count)
+        self.assertTrue(self.store.get(changed).is_enabled())
+
+    def test_does_nothing_when_the_wait_times_out(self):
+        feature_name = self.txt()
+        self.consul.kv.get.return_value = ("5", [self.entry(feature_name, 5)])
+        self.store._poll(None)
+
+        self.consul.kv.get.return_value = ("5", [])
+
+        self.assertEqual("5", self.store._poll("5"))
+        self.assertIsNotNone(self.store.get(feature_name))
+
+    def test_removes_deleted_flags(self):
+        kept, deleted = self.txt(), self.txt()
+        self.consul.kv.get.return_value = (
+            "5",
+            [self.entry(kept, 4), self.entry(deleted, 5)],
+        )
+        self.store._poll(None)
+
+        self.consul.kv.get.return_value = ("6", [self.entry(kept, 4)])
+        self.store._poll("5")
+
+        self.assertIsNotNone(self.store.get(kept))
+        self.assertIsNone(self.store.get(deleted))
+
+    def test_removes_every_flag_when_the_prefix_is_empty(self):
+        feature_name = self.txt()
+        self.consul.kv.get.return_value = ("5", [self.entry(feature_name, 5)])
+        self.store._poll(None)
+
+        self.consul.kv.get.return_value = ("6", None)
+        self.store._poll("5")
+
+        self.assertIsNone(self.store.get(feature_name))
+
+    def test_keeps_local_writes_consul_has_not_reported_yet(self):
+        feature_name = self.txt()
+        self.store.create(feature_name)
+
+        self.consul.kv.get.return_value = ("5", [])
+        self.store._poll(None)
+
+        self.assertIsNotNone(self.store.get(feature_name))
+
+
+class TestWatch(BaseTest):
+    def test_backs_off_exponentially_on_errors(self):
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 4:
+                self.store.stop()
+
+        self.consul.kv.get.side_effect = [
+            ConnectionError,
+            ConnectionError,
+            ("5", []),
+            ConnectionError,
+            ConnectionError,
+        ]
+        self.store._stopped.wait = wait
+
+        self.store._watch()
+
+        self.assertEqual([1.0, 2.0, 1.0, 2.0], waits)
+
+    def test_caps_backoff(self):
+        store = ConsulFeatureFlagStore(self.consul, max_backoff=3.0, start=False)
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 4:
+                store.stop()
+
+        self.consul.kv.get.side_effect = ConnectionError
+        store._stopped.wait = wait
+
+        store._watch()
+
+        self.assertEqual([1.0, 2.0, 3.0, 3.0], waits)
+
+
+class TestWrites(BaseTest):
+    def test_create_is_visible_immediately(self):
+        feature_name = self.txt()
+
+        self.store.create(feature_name, is_enabled=True)
+
+        self.assertTrue(self.store.get(feature_name).is_enabled())
+
+    def test_delete_is_visible_immediately(self):
+        feature_name = self.txt()
+        self.store.create(feature_name)
+
+        self.store.delete(feature_name)
+
+        self.assertIsNone(self.store.get(feature_name))
+        self.consul.kv.delete.assert_called_once_with("features/%s" % feature_name)
+
+
+class TestList(BaseTest):
+    def test_returns_features_subject_to_offset_and_limit(self):
+        feature_names = [self.txt() for _ in range(10)]
+
+        for name in feature_names:
+            self.store.create(name)
+
+        results = self.store.list(limit=3, offset=2)
+
+        expected = sorted(feature_names)[2:5]
+        actual = [item.feature_name for item in results]
+
+        self.assertEqual(expected, actual)
@@ -57,6 +57,18 @@ class TestGet(BaseTest):
         self.assertTrue(isinstance(self.store.get(feature_name), FeatureFlagStoreItem))
 
 
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        enabled, missing = self.txt(), self.txt()
+
+        self.store.create(enabled, is_enabled=True)
+
+        items = self.store.get_many([enabled, missing])
+
+        self.assertTrue(items[enabled].is_enabled())
+        self.assertIsNone(items[missing])
+
+
 class TestSet(BaseTest):
     def test_sets_correct_value_when_true(self):
         feature_name = self.txt()
@@ -80,6 +80,20 @@ class TestGet(BaseTest):
         self.assertIsNone(item)
 
 
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        self.store.create("enabled", is_enabled=True)
+        self.store.create("disabled")
+
+        items = self.store.get_many(["enabled", "disabled"])
+
+        self.assertTrue(items["enabled"].is_enabled())
+        self.assertFalse(items["disabled"].is_enabled())
+
+    def test_returns_none_for_missing_features(self):
+        self.assertEqual({"test": None}, self.store.get_many(["test"]))
+
+
 class TestList(BaseTest):
     def _create_several(self, names: Iterable[str]):
         for name in names:
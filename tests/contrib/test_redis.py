@@ -1,10 +1,16 @@
 import datetime
 import unittest
+from time import sleep
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import fakeredis
 
-from flipper import RedisFeatureFlagStore
+from flipper import (
+    CachedFeatureFlagStore,
+    RedisFeatureFlagStore,
+    RedisInvalidationSubscriber,
+)
 from flipper.contrib.interface import FlagDoesNotExistError
 from flipper.contrib.storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
 
@@ -81,6 +87,33 @@ class TestGet(BaseTest):
     pass
 
 
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        enabled, disabled = self.txt(), self.txt()
+
+        self.store.create(enabled, is_enabled=True)
+        self.store.create(disabled)
+
+        items = self.store.get_many([enabled, disabled])
+
+        self.assertTrue(items[enabled].is_enabled())
+        self.assertFalse(items[disabled].is_enabled())
+
+    def test_returns_none_for_missing_features(self):
+        feature_name = self.txt()
+
+        self.assertEqual({feature_name: None}, self.store.get_many([feature_name]))
+
+    def test_reads_in_batches(self):
+        store = RedisFeatureFlagStore(self.redis, list_method_batch_size=2)
+        feature_names = [self.txt() for _ in range(5)]
+
+        for feature_name in feature_names:
+            store.create(feature_name)
+
+        self.assertEqual(feature_names, list(store.get_many(feature_names).keys()))
+
+
 class TestSet(BaseTest):
     def test_sets_correct_value_when_true(self):
         feature_name = self.txt()
@@ -225,7 +258,7 @@ class TestList(BaseTest):
             self.assertTrue(feature_name in feature_names)
 
     def test_when_batch_size_is_set_to_a_value_smaller_than_number_of_keys_still_returns_everything(  # noqa: E501
-        self
+        self,
     ):
         feature_names = [self.txt() for _ in range(10)]
 
@@ -274,3 +307,117 @@ class TestSetMeta(BaseTest):
         feature_name = self.txt()
         with self.assertRaises(FlagDoesNotExistError):
             self.store.set_meta(feature_name, {"a": self.txt()})
+
+
+class TestInvalidationChannel(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.store = RedisFeatureFlagStore(
+            self.redis, invalidation_channel="invalidations"
+        )
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.subscribe("invalidations")
+
+    def published(self):
+        messages = []
+        for _ in range(10):
+            message = self.pubsub.get_message(timeout=0.001)
+            if message is not None:
+                messages.append(message["data"].decode("utf-8"))
+        return messages
+
+    def test_publishes_on_create(self):
+        feature_name = self.txt()
+
+        self.store.create(feature_name)
+
+        self.assertEqual([feature_name], self.published())
+
+    def test_publishes_on_set_and_set_meta(self):
+        feature_name = self.txt()
+        self.store.create(feature_name)
+        self.published()
+
+        self.store.set(feature_name, True)
+        self.store.set_meta(feature_name, FeatureFlagStoreMeta(self.date()))
+
+        self.assertEqual([feature_name, feature_name], self.published())
+
+    def test_publishes_on_delete(self):
+        feature_name = self.txt()
+        self.store.create(feature_name)
+        self.published()
+
+        self.store.delete(feature_name)
+
+        self.assertEqual([feature_name], self.published())
+
+    def test_does_not_publish_without_a_channel(self):
+        redis = MagicMock()
+        store = RedisFeatureFlagStore(redis)
+
+        store.create(self.txt())
+
+        redis.publish.assert_not_called()
+
+
+class TestRedisInvalidationSubscriber(BaseTest):
+    def setUp(self):
+        server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(server=server)
+        self.other_redis = fakeredis.FakeRedis(server=server)
+        self.store = RedisFeatureFlagStore(
+            self.redis, invalidation_channel="invalidations"
+        )
+        self.other_store = RedisFeatureFlagStore(
+            self.other_redis, invalidation_channel="invalidations"
+        )
+        self.cache = CachedFeatureFlagStore(self.store)
+        self.subscriber = RedisInvalidationSubscriber(
+            self.redis, "invalidations", [self.cache], poll_timeout=0.01
+        )
+        self.assertTrue(self.subscriber.wait_until_subscribed(1))
+
+    def tearDown(self):
+        self.subscriber.stop()
+
+    def wait_for(self, predicate):
+        for _ in range(100):
+            if predicate():
+                return True
+            sleep(0.01)
+        return False
+
+    def test_evicts_flags_changed_by_other_processes(self):
+        feature_name = self.txt()
+        self.other_store.create(feature_name)
+        self.assertFalse(self.cache.get(feature_name).is_enabled())
+
+        self.other_store.set(feature_name, True)
+
+        self.assertTrue(
+            self.wait_for(lambda: self.cache.get(feature_name).is_enabled())
+        )
+
+    def test_evicts_flags_deleted_by_other_processes(self):
+        feature_name = self.txt()
+        self.other_store.create(feature_name)
+        self.cache.get(feature_name)
+
+        self.other_store.delete(feature_name)
+
+        self.assertTrue(self.wait_for(lambda: self.cache.get(feature_name) is None))
+
+    def test_invalidates_everything_after_reconnecting(self):
+        cache = MagicMock()
+        redis = MagicMock()
+        redis.pubsub.side_effect = [ConnectionError, self.redis.pubsub()]
+
+        with unittest.mock.patch("flipper.contrib.redis.INITIAL_RECONNECT_DELAY", 0.01):
+            subscriber = RedisInvalidationSubscriber(
+                redis, "invalidations", [cache], poll_timeout=0.01
+            )
+            self.assertTrue(subscriber.wait_until_subscribed(1))
+        subscriber.stop()
+
+        cache.invalidate_all.assert_called_once_with()
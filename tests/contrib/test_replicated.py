@@ -71,6 +71,21 @@ class TestGet(BaseTest):
             replica.get.assert_not_called()
 
 
+class TestGetMany(BaseTest):
+    def test_forwards_all_arguments_to_primary_store_only(self):
+        feature_names = [self.txt(), self.txt()]
+
+        primary = MagicMock()
+        replicas = [MagicMock(), MagicMock(), MagicMock()]
+        store = ReplicatedFeatureFlagStore(primary, *replicas)
+
+        store.get_many(feature_names)
+
+        primary.get_many.assert_called_once_with(feature_names)
+        for replica in replicas:
+            replica.get_many.assert_not_called()
+
+
 class TestSet(BaseTest):
     def test_when_asynch_is_false_sets_value_in_primary_and_replicas(self):
         feature_name = self.txt()
@@ -216,3 +231,20 @@ class TestSetMeta(BaseTest):
         primary.set_meta.assert_called_once_with(*args, **kwargs)
         for replica in replicas:
             replica.set_meta.assert_called_once_with(*args, **kwargs)
+
+    def test_forwards_existing_item_to_primary_store_only(self):
+        feature_name = self.txt()
+
+        meta = FeatureFlagStoreMeta(datetime(2018, 5, 4))
+
+        primary = MagicMock()
+        replicas = [MagicMock(), MagicMock(), MagicMock()]
+        store = ReplicatedFeatureFlagStore(primary, *replicas)
+
+        existing = MagicMock()
+
+        store.set_meta(feature_name, meta, existing=existing)
+
+        primary.set_meta.assert_called_once_with(feature_name, meta, existing=existing)
+        for replica in replicas:
+            replica.set_meta.assert_called_once_with(feature_name, meta)
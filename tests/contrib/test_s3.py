@@ -108,6 +108,24 @@ class TestGet(BaseTest):
         self.assertIsNone(self.store.get(feature_name))
 
 
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        enabled, disabled = self.txt(), self.txt()
+
+        self.store.create(enabled, is_enabled=True)
+        self.store.create(disabled)
+
+        items = self.store.get_many([enabled, disabled])
+
+        self.assertTrue(items[enabled].is_enabled())
+        self.assertFalse(items[disabled].is_enabled())
+
+    def test_returns_none_for_missing_features(self):
+        feature_name = self.txt()
+
+        self.assertEqual({feature_name: None}, self.store.get_many([feature_name]))
+
+
 class TestSet(BaseTest):
     def test_sets_correct_value_when_true(self):
         feature_name = self.txt()
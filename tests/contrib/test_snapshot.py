@@ -0,0 +1,198 @@
+import unittest
+from datetime import datetime
+from time import sleep
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from flipper import MemoryFeatureFlagStore, SnapshotFeatureFlagStore
+from flipper.contrib.storage import FeatureFlagStoreItem, FeatureFlagStoreMeta
+
+
+class BaseTest(unittest.TestCase):
+    def setUp(self):
+        self.slow = MemoryFeatureFlagStore()
+        self.fast = SnapshotFeatureFlagStore(self.slow, start=False)
+
+    def txt(self):
+        return uuid4().hex
+
+
+class TestInit(BaseTest):
+    def test_loads_every_flag_from_the_wrapped_store(self):
+        feature_name = self.txt()
+        self.slow.create(feature_name, is_enabled=True)
+
+        fast = SnapshotFeatureFlagStore(self.slow, start=False)
+
+        self.assertTrue(fast.get(feature_name).is_enabled())
+
+    def test_raises_when_first_load_fails_without_fallback(self):
+        slow = MagicMock()
+        slow.list.side_effect = ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            SnapshotFeatureFlagStore(slow, start=False)
+
+    def test_uses_fallback_when_first_load_fails(self):
+        slow = MagicMock()
+        slow.list.side_effect = ConnectionError
+
+        feature_name = self.txt()
+        item = FeatureFlagStoreItem(
+            feature_name, True, FeatureFlagStoreMeta(int(datetime.now().timestamp()))
+        )
+
+        fast = SnapshotFeatureFlagStore(slow, fallback=[item], start=False)
+
+        self.assertTrue(fast.get(feature_name).is_enabled())
+        self.assertEqual(1, fast.refresh_failure_count)
+        self.assertIsNone(fast.staleness)
+
+
+class TestGet(BaseTest):
+    def test_does_not_read_from_the_wrapped_store(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.slow.get = MagicMock()
+
+        self.fast.get(feature_name)
+
+        self.slow.get.assert_not_called()
+
+    def test_returns_none_for_missing_flags(self):
+        self.assertIsNone(self.fast.get(self.txt()))
+
+    def test_does_not_see_changes_until_refreshed(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.slow.set(feature_name, True)
+
+        self.assertFalse(self.fast.get(feature_name).is_enabled())
+
+        self.fast.refresh()
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+
+class TestRefresh(BaseTest):
+    def test_removes_flags_deleted_from_the_wrapped_store(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.slow.delete(feature_name)
+        self.fast.refresh()
+
+        self.assertIsNone(self.fast.get(feature_name))
+
+    def test_keeps_previous_snapshot_when_refresh_fails(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.slow.list = MagicMock(side_effect=ConnectionError)
+
+        with self.assertRaises(ConnectionError):
+            self.fast.refresh()
+
+        self.assertIsNotNone(self.fast.get(feature_name))
+        self.assertIsInstance(self.fast.last_refresh_error, ConnectionError)
+
+    def test_tracks_staleness(self):
+        self.fast.refresh()
+        staleness = self.fast.staleness
+
+        sleep(0.01)
+
+        self.assertGreater(self.fast.staleness, staleness)
+
+    def test_refreshes_in_the_background(self):
+        fast = SnapshotFeatureFlagStore(self.slow, refresh_interval=0.01)
+        feature_name = self.txt()
+
+        self.slow.create(feature_name)
+        sleep(0.1)
+        fast.stop()
+
+        self.assertIsNotNone(fast.get(feature_name))
+        self.assertGreater(fast.refresh_count, 1)
+
+
+class TestInvalidate(BaseTest):
+    def test_reloads_a_single_flag(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+        self.slow.set(feature_name, True)
+
+        self.fast.invalidate(feature_name)
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+
+    def test_removes_flags_deleted_from_the_wrapped_store(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+        self.slow.delete(feature_name)
+
+        self.fast.invalidate(feature_name)
+
+        self.assertIsNone(self.fast.get(feature_name))
+
+
+class TestWrites(BaseTest):
+    def test_set_is_visible_immediately(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.fast.set(feature_name, True)
+
+        self.assertTrue(self.fast.get(feature_name).is_enabled())
+        self.assertTrue(self.slow.get(feature_name).is_enabled())
+
+    def test_set_meta_is_visible_immediately(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        meta = FeatureFlagStoreMeta(
+            int(datetime.now().timestamp()), client_data={"foo": "bar"}
+        )
+        self.fast.set_meta(feature_name, meta)
+
+        self.assertEqual(
+            {"foo": "bar"}, self.fast.get(feature_name).meta["client_data"]
+        )
+
+    def test_delete_is_visible_immediately(self):
+        feature_name = self.txt()
+        self.fast.create(feature_name)
+
+        self.fast.delete(feature_name)
+
+        self.assertIsNone(self.fast.get(feature_name))
+        self.assertIsNone(self.slow.get(feature_name))
+
+
+class TestList(BaseTest):
+    def test_returns_features_subject_to_offset_and_limit(self):
+        feature_names = [self.txt() for _ in range(10)]
+
+        for name in feature_names:
+            self.fast.create(name)
+
+        results = self.fast.list(limit=3, offset=2)
+
+        expected = sorted(feature_names)[2:5]
+        actual = [item.feature_name for item in results]
+
+        self.assertEqual(expected, actual)
+
+
+class TestGetMany(BaseTest):
+    def test_returns_items_keyed_by_feature_name(self):
+        enabled, missing = self.txt(), self.txt()
+
+        self.fast.create(enabled, is_enabled=True)
+
+        items = self.fast.get_many([enabled, missing])
+
+        self.assertTrue(items[enabled].is_enabled())
+        self.assertIsNone(items[missing])
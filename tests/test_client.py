@@ -100,6 +100,57 @@ class TestIsEnabled(BaseTest):
 
         bucketer.check.assert_called_with(foo=True)
 
+    def test_compiled_flags_respect_conditions(self):
+        client = FeatureFlagClient(self.store, compile_flags=True)
+        feature_name = self.txt()
+
+        client.create(feature_name, is_enabled=True)
+        client.add_condition(feature_name, Condition(foo=True))
+
+        self.assertTrue(client.is_enabled(feature_name, foo=True))
+        self.assertFalse(client.is_enabled(feature_name, foo=False))
+
+    def test_compiled_flags_return_default_when_feature_does_not_exist(self):
+        client = FeatureFlagClient(self.store, compile_flags=True)
+
+        self.assertTrue(client.is_enabled(self.txt(), default=True))
+
+
+class TestIsEnabledMany(BaseTest):
+    def test_returns_result_for_every_feature(self):
+        enabled, disabled = self.txt(), self.txt()
+
+        self.client.create(enabled, is_enabled=True)
+        self.client.create(disabled)
+
+        results = self.client.is_enabled_many([enabled, disabled])
+
+        self.assertEqual({enabled: True, disabled: False}, results)
+
+    def test_returns_default_when_feature_does_not_exist(self):
+        feature_name = self.txt()
+
+        results = self.client.is_enabled_many([feature_name], default=True)
+
+        self.assertEqual({feature_name: True}, results)
+
+    def test_applies_conditions_to_every_feature(self):
+        feature_name = self.txt()
+
+        self.client.create(feature_name, is_enabled=True)
+        self.client.add_condition(feature_name, Condition(foo=True))
+
+        results = self.client.is_enabled_many([feature_name], foo=False)
+
+        self.assertEqual({feature_name: False}, results)
+
+    def test_reads_from_store_exactly_once(self):
+        self.store.get_many = MagicMock(wraps=self.store.get_many)
+
+        self.client.is_enabled_many([self.txt(), self.txt()])
+
+        self.assertEqual(1, self.store.get_many.call_count)
+
 
 class TestCreate(BaseTest):
     def test_creates_and_returns_instance_of_feature_flag_class(self):
@@ -732,3 +783,57 @@ class TestSetConditions(BaseTest):
             ("pre_set_conditions", feature_name, new_conditions),
             ("post_set_conditions", feature_name, new_conditions),
         ]
+
+
+class TestStoreReads(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.feature_name = self.txt()
+        self.client.create(self.feature_name)
+        self.store.get = MagicMock(wraps=self.store.get)
+
+    def test_enable_reads_from_store_exactly_once(self):
+        self.client.enable(self.feature_name)
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_disable_reads_from_store_exactly_once(self):
+        self.client.disable(self.feature_name)
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_add_condition_reads_from_store_exactly_once(self):
+        self.client.add_condition(self.feature_name, Condition(foo=True))
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_set_client_data_reads_from_store_exactly_once(self):
+        self.client.set_client_data(self.feature_name, {self.txt(): self.txt()})
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_set_bucketer_reads_from_store_exactly_once(self):
+        bucketer = PercentageBucketer(percentage=Percentage(0.1))
+
+        self.client.set_bucketer(self.feature_name, bucketer)
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_set_conditions_reads_from_store_exactly_once(self):
+        self.client.set_conditions(self.feature_name, [Condition(foo=True)])
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_get_meta_reads_from_store_exactly_once(self):
+        self.client.get_meta(self.feature_name)
+
+        self.assertEqual(1, self.store.get.call_count)
+
+    def test_set_meta_is_passed_the_item_that_was_read(self):
+        self.store.set_meta = MagicMock()
+
+        self.client.set_client_data(self.feature_name, {self.txt(): self.txt()})
+
+        existing = self.store.set_meta.call_args[1]["existing"]
+
+        self.assertEqual(self.feature_name, existing.feature_name)